@@ -0,0 +1,32 @@
+"""Optional ``numba`` support.
+
+``numba`` is not a required dependency of DeepSensor. Functions decorated with
+:func:`optional_njit` are compiled with ``numba.njit`` if it is installed, and
+are replaced with ``None`` otherwise, so that callers can check for ``None``
+and fall back to numpy.
+"""
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+def optional_njit(**options):
+    """Decorator compiling a function with ``numba.njit(**options)``.
+
+    Args:
+        **options:
+            Options passed to ``numba.njit``, e.g. ``parallel=True``.
+
+    Returns:
+        callable: Decorator returning the compiled function, or ``None`` if
+        ``numba`` is not installed.
+    """
+
+    def decorator(f):
+        if numba is None:  # pragma: no cover
+            return None
+        return numba.njit(**options)(f)
+
+    return decorator
@@ -1,12 +1,14 @@
-import copy
+import math
 from typing import Optional
 
 import numpy as np
 
+from scipy.special import ndtr
 from scipy.stats import norm
 
 from deepsensor.model.model import ProbabilisticModel
 from deepsensor.data.task import Task
+from deepsensor._numba import numba, optional_njit
 
 
 class AcquisitionFunction:
@@ -312,7 +314,7 @@ class Random(AcquisitionFunctionParallel):
 
     min_or_max = "max"
 
-    def __init__(self, *args, seed: int = 42, **kwargs):
+    def __init__(self, *args, seed: int = 42, dtype=np.float32, **kwargs):
         """...
 
         :no-index:
@@ -320,9 +322,14 @@ class Random(AcquisitionFunctionParallel):
         Args:
             seed (int, optional):
                 Random seed, defaults to 42.
+            dtype (:class:`numpy:numpy.dtype`, optional):
+                Floating point type of the random values, either
+                ``np.float32`` or ``np.float64``. Defaults to ``np.float32``.
         """
         super().__init__(*args, **kwargs)
         self.rng = np.random.default_rng(seed)
+        self._dtype = dtype
+        self._buf = None
 
     def __call__(self, task: Task, X_s: np.ndarray, **kwargs):
         """...
@@ -337,10 +344,16 @@ class Random(AcquisitionFunctionParallel):
                 [Description of the X_s parameter.]
 
         Returns:
-            float:
-                A random acquisition function value.
+            :class:`numpy:numpy.ndarray`:
+                Random acquisition function values. Shape (N_search,). The
+                array is reused between calls, so copy it if it needs to
+                outlive the next call.
         """
-        return self.rng.random(X_s.shape[1])
+        n_search = X_s.shape[1]
+        if self._buf is None or self._buf.shape[0] != n_search:
+            self._buf = np.empty(n_search, dtype=self._dtype)
+        self.rng.random(out=self._buf, dtype=self._dtype)
+        return self._buf
 
 
 class ContextDist(AcquisitionFunctionParallel):
@@ -371,7 +384,7 @@ class ContextDist(AcquisitionFunctionParallel):
             #    acquisition fn to non-zero and all others to zero
             dist_to_closest_sensor = np.zeros(X_s.shape[-1])
             dist_to_closest_sensor[0] = 1
-        else:
+        elif X_c.shape[1] < 16:
             # Use broadcasting to get matrix of distances from each possible
             #   new sensor location to each existing sensor location
             dists_all = np.linalg.norm(
@@ -381,6 +394,19 @@ class ContextDist(AcquisitionFunctionParallel):
 
             # Compute distance to nearest sensor
             dist_to_closest_sensor = dists_all.min(axis=1)
+        else:
+            # Expand ||x_s - x_c||^2 = ||x_s||^2 + ||x_c||^2 - 2 x_s.x_c so that the
+            #   pairwise term is a single matrix product rather than a (2, N_s, N_c)
+            #   broadcasted difference array. Compute in float64, as the
+            #   expansion cancels catastrophically in float32 near sensors
+            X_s = X_s.astype(np.float64, copy=False)
+            X_c = X_c.astype(np.float64, copy=False)
+            X_s_sq = np.einsum("ij,ij->j", X_s, X_s)
+            X_c_sq = np.einsum("ij,ij->j", X_c, X_c)
+            sq_dists_all = X_s_sq[:, None] + X_c_sq[None, :] - 2.0 * (X_s.T @ X_c)
+
+            # Compute distance to nearest sensor, clipping negative round-off error
+            dist_to_closest_sensor = np.sqrt(np.maximum(sq_dists_all.min(axis=1), 0.0))
         return dist_to_closest_sensor
 
 
@@ -406,12 +432,31 @@ class Stddev(AcquisitionFunctionParallel):
                 [Description of the return value.]
         """
         # Set the target points to the search points
-        task = copy.deepcopy(task)
-        task["X_t"] = X_s
+        task = task.shallow_copy(X_t=X_s)
 
         return self.model.stddev(task)[self.target_set_idx]
 
 
+# Search points below which the fused EI kernel is not worth compiling and calling
+_EI_KERNEL_MIN_SIZE = 4096
+
+
+@optional_njit(parallel=True, fastmath=True, cache=True)
+def _ei_kernel(mean, stddev, best_target_value):
+    """Expected improvement over flat arrays of predictive means and standard
+    deviations, fused into one pass. ``Z`` is zero where ``stddev`` is not
+    positive. ``None`` if ``numba`` is not installed.
+    """
+    ei = np.empty_like(mean)
+    for i in numba.prange(mean.size):
+        improvement = mean[i] - best_target_value
+        z = improvement / stddev[i] if stddev[i] > 0 else 0.0
+        cdf = 0.5 * (1.0 + math.erf(z * 0.7071067811865476))
+        pdf = math.exp(-0.5 * z * z) * 0.3989422804014327
+        ei[i] = stddev[i] * (improvement * cdf + pdf)
+    return ei
+
+
 class ExpectedImprovement(AcquisitionFunctionParallel):
     """Expected improvement acquisition function.
 
@@ -438,25 +483,47 @@ class ExpectedImprovement(AcquisitionFunctionParallel):
                 Acquisition function value/s. Shape (N_search,).
         """
         # Set the target points to the search points
-        task = copy.deepcopy(task)
-        task["X_t"] = X_s
+        task = task.shallow_copy(X_t=X_s)
 
-        # Compute the predictive mean and variance of the target set
-        mean = self.model.mean(task)[self.target_set_idx]
+        Y_c = task["Y_c"][self.context_set_idx]
+        if Y_c.size == 0 or np.isnan(Y_c).all():
+            # No previous observations, so there is no best target value to improve
+            # on. Heuristically use the predictive standard deviation as the
+            # acquisition function to select the most uncertain location.
+            return self.model.stddev(task)[self.target_set_idx]
 
-        if task["Y_c"][self.context_set_idx].size == 0:
-            # No previous context points, so heuristically use the predictive mean as the
-            # acquisition function. This will at least select the most positive predicted mean.
-            return self.model.mean(task)[self.target_set_idx]
-        else:
-            # Determine the best target value seen so far
-            best_target_value = task["Y_c"][self.context_set_idx].max()
+        # Determine the best target value seen so far
+        best_target_value = np.nanmax(Y_c)
 
-        # Compute the standard deviation of the context set
-        stddev = self.model.stddev(task)[self.context_set_idx]
+        # If the model returns a distribution, run it forwards once and re-use
+        #   the distribution for the mean and standard deviation
+        pred = self.model(task) if hasattr(self.model, "__call__") else task
 
-        # Compute the expected improvement
-        Z = (mean - best_target_value) / stddev
-        ei = stddev * (mean - best_target_value) * norm.cdf(Z) + stddev * norm.pdf(Z)
+        # Compute the predictive mean and variance of the target set
+        mean = self.model.mean(pred)[self.target_set_idx]
+
+        # Compute the standard deviation of the context set
+        stddev = self.model.stddev(pred)[self.context_set_idx]
+
+        if (
+            _ei_kernel is not None
+            and mean.size >= _EI_KERNEL_MIN_SIZE
+            and mean.shape == stddev.shape
+        ):
+            # Fused single pass over the search points
+            ei = _ei_kernel(
+                np.ascontiguousarray(mean).ravel(),
+                np.ascontiguousarray(stddev, dtype=mean.dtype).ravel(),
+                float(best_target_value),
+            )
+            return ei.reshape(mean.shape)
+
+        # Compute the expected improvement, guarding against zero predictive stddev
+        improvement = mean - best_target_value
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Z = np.where(stddev > 0, improvement / stddev, 0.0)
+        pdf = np.exp(-0.5 * Z * Z) * (1.0 / np.sqrt(2.0 * np.pi))
+        cdf = ndtr(Z)
+        ei = stddev * (improvement * cdf + pdf)
 
         return ei
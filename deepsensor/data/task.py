@@ -6,8 +6,30 @@ import lab as B
 import plum
 import copy
 
+from .._numba import numba, optional_njit
 from ..errors import TaskSetIndexError, GriddedDataError
 
+# Array size below which `np.ma.fix_invalid` is as fast as the NaN-filling kernel
+_NAN_FILL_KERNEL_MIN_SIZE = 1 << 14
+
+
+@optional_njit(parallel=True, cache=True)
+def _nan_fill_and_mask(arr, out, mask):
+    """Write flat array ``arr`` to ``out`` with non-finite values set to zero,
+    and set ``mask`` to True where they were. ``None`` if ``numba`` is not
+    installed.
+
+    ``fastmath`` must not be used here, as it assumes there are no NaNs.
+    """
+    for i in numba.prange(arr.size):
+        x = arr[i]
+        if np.isfinite(x):
+            out[i] = x
+            mask[i] = False
+        else:
+            out[i] = 0.0
+            mask[i] = True
+
 
 class Task(dict):
     """Task dictionary class.
@@ -92,6 +114,29 @@ class Task(dict):
             s += f"{k}: {Task.summarise_repr(k, v)}\n"
         return s
 
+    def shallow_copy(self, **entries) -> "Task":
+        """Return a shallow copy of the task, optionally replacing some entries.
+
+        Unlike ``copy.deepcopy``, the arrays in the task are not copied, so the
+        copy must not be modified in place. Entries should instead be replaced,
+        e.g. ``task.shallow_copy(X_t=X_new)`` or by setting ``task["X_c"] =
+        [...]`` on the copy. The ``ops`` list is copied, so operations applied
+        to the copy are not recorded in the original.
+
+        Args:
+            **entries:
+                Entries to replace in the copy.
+
+        Returns:
+            :class:`deepsensor.data.task.Task`:
+                Shallow copy of the task.
+        """
+        task = copy.copy(self)
+        task["ops"] = list(self["ops"])
+        for k, v in entries.items():
+            task[k] = v
+        return task
+
     def op(self, f: Callable, op_flag: Optional[str] = None):
         """Apply function f to the array elements of a task dictionary.
 
@@ -278,8 +323,23 @@ class Task(dict):
             else:
                 mask = np.isnan(arr)
                 if np.any(mask):
-                    # arr = np.ma.MaskedArray(arr, mask=mask, fill_value=0.0)
-                    arr = np.ma.fix_invalid(arr, fill_value=0.0)
+                    if (
+                        _nan_fill_and_mask is not None
+                        and arr.size >= _NAN_FILL_KERNEL_MIN_SIZE
+                        and arr.dtype in (np.float32, np.float64)
+                        and arr.flags.c_contiguous
+                        and not isinstance(arr, np.ma.MaskedArray)
+                    ):
+                        # Equivalent to `np.ma.fix_invalid`, in a single pass over `arr`
+                        data = np.empty_like(arr)
+                        invalid = np.empty(arr.shape, dtype=bool)
+                        _nan_fill_and_mask(
+                            arr.reshape(-1), data.reshape(-1), invalid.reshape(-1)
+                        )
+                        arr = np.ma.MaskedArray(data, mask=invalid, fill_value=0.0)
+                    else:
+                        # arr = np.ma.MaskedArray(arr, mask=mask, fill_value=0.0)
+                        arr = np.ma.fix_invalid(arr, fill_value=0.0)
             return arr
 
         return self.op(lambda x: f(x), op_flag="numpy_mask")
@@ -335,12 +395,9 @@ def append_obs_to_task(
 ):
     """Append a single observation to a context set in ``task``.
 
-    Makes a deep copy of the data structure to avoid affecting the original
-    object.
-
-    ..
-        TODO: for speed during active learning algs, consider a shallow copy
-        option plus ability to remove observations.
+    The original object is not affected. Only the context set being appended
+    to is reallocated; all other arrays are shared with ``task`` via
+    :meth:`Task.shallow_copy`.
 
     Args:
         task (:class:`deepsensor.data.task.Task`:): The task to modify.
@@ -358,7 +415,7 @@ def append_obs_to_task(
     if isinstance(task["X_c"][context_set_idx], tuple):
         raise GriddedDataError("Cannot append to gridded data")
 
-    task_with_new = copy.deepcopy(task)
+    task_with_new = task.shallow_copy(X_c=list(task["X_c"]), Y_c=list(task["Y_c"]))
 
     if Y_new.ndim == 0:
         # Add size-1 observation and data dimension
@@ -395,8 +452,13 @@ def flatten_X(X: Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]) -> np.ndarray
             ...
     """
     if type(X) is tuple:
-        X1, X2 = np.meshgrid(X[0], X[1], indexing="ij")
-        X = np.stack([X1.ravel(), X2.ravel()], axis=0)
+        # Equivalent to stacking the raveled `np.meshgrid(*X, indexing="ij")`, but
+        #   broadcasts into a single preallocated array
+        x1, x2 = np.ravel(X[0]), np.ravel(X[1])
+        X = np.empty((2, x1.size, x2.size), dtype=np.result_type(x1, x2))
+        X[0] = x1[:, None]
+        X[1] = x2[None, :]
+        X = X.reshape(2, -1)
     return X
 
 
@@ -539,6 +601,107 @@ def concat_tasks(tasks: List[Task], multiple: int = 1) -> Task:
     return merged_task
 
 
+def _task_batch_key(task: Task) -> Optional[tuple]:
+    """Return a key that is equal for tasks whose arrays can be stacked along a
+    new batch dimension, or ``None`` if the task cannot be stacked.
+    """
+    if len(task["ops"]) > 0:
+        # Task has already been modified (e.g. batch dim added or NaNs masked)
+        return None
+
+    def shape(v):
+        if type(v) is tuple:
+            return tuple(shape(vi) for vi in v)
+        elif type(v) is np.ndarray:
+            return v.shape
+        raise TypeError
+
+    try:
+        key = [shape(v) for k in ("X_c", "Y_c", "X_t") for v in task[k]]
+        if "Y_t_aux" in task.keys():
+            key.append(shape(task["Y_t_aux"]))
+    except TypeError:
+        return None
+    return tuple(key)
+
+
+def group_tasks_into_batches(tasks: List[Task], batch_size: int) -> List[List[Task]]:
+    """Group tasks into batches of tasks that can be stacked with :func:`stack_tasks`.
+
+    Tasks are grouped by the shapes of their context and target arrays, and
+    each group is split into batches of at most ``batch_size`` tasks. Tasks
+    that cannot be stacked are returned in their own batch of size 1.
+
+    Args:
+        tasks (List[:class:`deepsensor.data.task.Task`:]):
+            List of tasks to group.
+        batch_size (int):
+            Maximum number of tasks in a batch.
+
+    Returns:
+        List[List[:class:`deepsensor.data.task.Task`:]]: List of task batches.
+    """
+    groups = {}
+    batches = []
+    for task in tasks:
+        key = _task_batch_key(task)
+        if key is None:
+            batches.append([task])
+            continue
+        group = groups.setdefault(key, [])
+        group.append(task)
+        if len(group) == batch_size:
+            batches.append(group)
+            groups[key] = []
+    batches.extend(group for group in groups.values() if len(group) > 0)
+    return batches
+
+
+def stack_tasks(tasks: List[Task]) -> Task:
+    """Stack a list of tasks with equal array shapes into a single task with a
+    batch dimension.
+
+    Unlike :func:`concat_tasks`, no padding is applied to the context sets, so
+    all tasks must have the same number of context and target points (see
+    :func:`group_tasks_into_batches`). Target observations are dropped, so the
+    stacked task can only be used for prediction.
+
+    Args:
+        tasks (List[:class:`deepsensor.data.task.Task`:]):
+            List of tasks to stack.
+
+    Returns:
+        :class:`~.data.task.Task`: Task containing multiple batches.
+    """
+    if len(tasks) == 1:
+        return tasks[0]
+
+    def stack(*vs):
+        if type(vs[0]) is tuple:
+            # Gridded coords: ensure shape (1, N) before stacking to (N_batch, 1, N)
+            return tuple(
+                np.stack([np.atleast_2d(x) for x in vi], axis=0) for vi in zip(*vs)
+            )
+        return np.stack(vs, axis=0)
+
+    stacked_task = {}
+    for k, v in tasks[0].items():
+        if k in ("X_c", "Y_c", "X_t"):
+            stacked_task[k] = [stack(*vs) for vs in zip(*[t[k] for t in tasks])]
+        elif k == "Y_t_aux":
+            stacked_task[k] = stack(*[t[k] for t in tasks])
+        elif k == "Y_t":
+            stacked_task[k] = None
+        elif k == "time":
+            stacked_task[k] = [t["time"] for t in tasks]
+        elif k == "ops":
+            stacked_task[k] = [*v, "batch_dim"]
+        else:
+            stacked_task[k] = v
+
+    return Task(stacked_task)
+
+
 if __name__ == "__main__":  # pragma: no cover
     # print working directory
     import os
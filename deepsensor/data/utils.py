@@ -137,13 +137,19 @@ def compute_pandas_data_resolution(
             # Skip this time if there are fewer than 2 stationS
             continue
         X_unique = np.unique(X, axis=0)  # (N_unique, 2) array of unique coordinates
-
-        pairwise_distances = scipy.spatial.distance.cdist(X_unique, X_unique)
-        percentile_distances_without_self = np.ma.masked_equal(pairwise_distances, 0)
+        if X_unique.shape[0] < 2:
+            continue
 
         # Compute the closest distance from each station to each other station
-        closest_distances_t = np.min(percentile_distances_without_self, axis=1)
-        closest_distances.extend(closest_distances_t)
-
+        #   (the nearest neighbour with k=1 is the station itself)
+        tree = scipy.spatial.cKDTree(X_unique)
+        closest_distances_t = tree.query(X_unique, k=2, workers=-1)[0][:, 1]
+        closest_distances.append(closest_distances_t)
+
+    # Concatenate once rather than growing a list of numpy scalars. np.percentile
+    #   selects the order statistics with np.partition, so no full sort is done
+    closest_distances = (
+        np.concatenate(closest_distances) if closest_distances else np.empty(0)
+    )
     data_resolution = np.percentile(closest_distances, percentile)
     return data_resolution
@@ -1,6 +1,5 @@
 # ruff: noqa: D102
 
-import copy
 import os.path
 import json
 from typing import Union, List, Literal, Optional
@@ -36,6 +35,15 @@ TFModel = ModuleType("tensorflow.keras", "Model")
 TorchModel = ModuleType("torch.nn", "Module")
 
 
+def _sqrt(x: np.ndarray, in_place: bool = False) -> np.ndarray:
+    """Elementwise square root, overwriting ``x`` if ``in_place`` and ``x`` is
+    writeable.
+    """
+    if in_place and isinstance(x, np.ndarray) and x.flags.writeable:
+        return np.sqrt(x, out=x)
+    return np.sqrt(x)
+
+
 class ConvNP(DeepSensorModel):
     """A Convolutional Neural Process (ConvNP) regression probabilistic model (by default a ConvCNP).
 
@@ -52,14 +60,12 @@ class ConvNP(DeepSensorModel):
         - a ``DataProcessor`` object to auto-unnormalise the data at inference time with the ``.predict`` method.
         - a ``TaskLoader`` object to infer sensible default model parameters from the data.
 
-    Multiple dispatch is implemented using ``plum`` to allow for re-using the
-    model's forward prediction object when computing the logpdf, entropy, etc.
-    Alternatively, the model can be run forwards with a ``Task`` object of data
-    from the ``TaskLoader``.
-
-    Many of the ``ConvNP`` class methods utilise multiple dispatch so that they
-    can either be run with a ``Task`` object or a ``neuralprocesses`` distribution
-    object. This allows for re-using the model's forward prediction object.
+    Many of the ``ConvNP`` class methods can either be run with a ``Task``
+    object of data from the ``TaskLoader`` or with a ``neuralprocesses``
+    distribution object (e.g. ``dist = model(task)``). This allows for re-using
+    the model's forward prediction object when computing the mean, logpdf,
+    entropy, etc. Multiple dispatch (using ``plum``) is only used for the
+    constructors and ``slice_diag``.
 
     Dimension shapes are expressed in method docstrings in terms of:
         - ``N_features``: number of features/dimensions in the target set.
@@ -411,11 +417,25 @@ class ConvNP(DeepSensorModel):
         x: Union[B.Numeric, List[B.Numeric]],
         squeeze_axes: List[int] = (0, 1),
     ):
-        """TODO docstring."""
+        """Convert model output to numpy and squeeze out size-1 dimensions.
+
+        The last of ``squeeze_axes`` is the batch dimension. It is only squeezed
+        out if it has size 1, so that outputs for a batch of several tasks
+        (see :meth:`~.model.model.DeepSensorModel.predict`) keep a batch
+        dimension in place of the squeezed axes.
+        """
+
+        def squeeze(xi):
+            xi = B.to_numpy(xi)
+            *other_axes, batch_axis = squeeze_axes
+            if xi.shape[batch_axis] != 1:
+                return np.squeeze(xi, axis=tuple(other_axes))
+            return np.squeeze(xi, axis=squeeze_axes)
+
         if isinstance(x, backend.nps.Aggregate):
-            return [np.squeeze(B.to_numpy(xi), axis=squeeze_axes) for xi in x]
+            return [squeeze(xi) for xi in x]
         else:
-            return np.squeeze(B.to_numpy(x), axis=squeeze_axes)
+            return squeeze(x)
 
     def _maybe_concat_multi_targets(
         self,
@@ -451,92 +471,79 @@ class ConvNP(DeepSensorModel):
         else:
             return x
 
-    @dispatch
-    def mean(self, dist: AbstractMultiOutputDistribution):
-        mean = dist.mean
-        mean = self._cast_numpy_and_squeeze(mean)
-        return self._maybe_concat_multi_targets(mean)
+    def _get_dist(self, task: Union[Task, AbstractMultiOutputDistribution]):
+        """Run the model on ``task``, or return ``task`` if it is already a
+        distribution output by the model.
 
-    @dispatch
-    def mean(self, task: Task):
+        Used in place of multiple dispatch on the prediction methods below,
+        which are called once per task during prediction.
+        """
+        if isinstance(task, Task):
+            return self(task)
+        return task
+
+    def mean(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Mean values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Mean values.
         """
-        dist = self(task)
-        return self.mean(dist)
-
-    @dispatch
-    def variance(self, dist: AbstractMultiOutputDistribution):
-        variance = dist.var
-        variance = self._cast_numpy_and_squeeze(variance)
-        return self._maybe_concat_multi_targets(variance)
+        mean = self._get_dist(task).mean
+        mean = self._cast_numpy_and_squeeze(mean)
+        return self._maybe_concat_multi_targets(mean)
 
-    @dispatch
-    def variance(self, task: Task):
+    def variance(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Variance values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Variance values.
         """
-        dist = self(task)
-        return self.variance(dist)
-
-    @dispatch
-    def std(self, dist: AbstractMultiOutputDistribution):
-        variance = self.variance(dist)
-        if isinstance(variance, (list, tuple)):
-            return [np.sqrt(v) for v in variance]
-        else:
-            return np.sqrt(variance)
+        variance = self._get_dist(task).var
+        variance = self._cast_numpy_and_squeeze(variance)
+        return self._maybe_concat_multi_targets(variance)
 
-    @dispatch
-    def std(self, task: Task):
+    def std(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Standard deviation values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Standard deviation values.
         """
-        dist = self(task)
-        return self.std(dist)
+        variance = self.variance(task)
+        # When run with a task, the variances come from a forward pass that
+        #   nothing else references, so the square root can be taken in place
+        in_place = isinstance(task, Task)
+        if isinstance(variance, (list, tuple)):
+            return [_sqrt(v, in_place) for v in variance]
+        else:
+            return _sqrt(variance, in_place)
 
-    @dispatch
     def alpha(
-        self, dist: AbstractMultiOutputDistribution
+        self, task: Union[Task, AbstractMultiOutputDistribution]
     ) -> Union[np.ndarray, List[np.ndarray]]:
-        if self.config["likelihood"] not in ["spikes-beta"]:
-            raise NotImplementedError(
-                f"ConvNP.alpha method not supported for likelihood {self.config['likelihood']}. "
-                f"Valid likelihoods: 'spikes-beta'."
-            )
-        alpha = dist.slab.alpha
-        alpha = self._cast_numpy_and_squeeze(alpha)
-        return self._maybe_concat_multi_targets(alpha)
-
-    @dispatch
-    def alpha(self, task: Task) -> Union[np.ndarray, List[np.ndarray]]:
         """Alpha parameter values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
@@ -548,31 +555,26 @@ class ConvNP(DeepSensorModel):
             the slab component of the mixture model.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Alpha values.
         """
-        dist = self(task)
-        return self.alpha(dist)
-
-    @dispatch
-    def beta(
-        self, dist: AbstractMultiOutputDistribution
-    ) -> Union[np.ndarray, List[np.ndarray]]:
         if self.config["likelihood"] not in ["spikes-beta"]:
             raise NotImplementedError(
-                f"ConvNP.beta method not supported for likelihood {self.config['likelihood']}. "
+                f"ConvNP.alpha method not supported for likelihood {self.config['likelihood']}. "
                 f"Valid likelihoods: 'spikes-beta'."
             )
-        beta = dist.slab.beta
-        beta = self._cast_numpy_and_squeeze(beta)
-        return self._maybe_concat_multi_targets(beta)
+        alpha = self._get_dist(task).slab.alpha
+        alpha = self._cast_numpy_and_squeeze(alpha)
+        return self._maybe_concat_multi_targets(alpha)
 
-    @dispatch
-    def beta(self, task: Task) -> Union[np.ndarray, List[np.ndarray]]:
+    def beta(
+        self, task: Union[Task, AbstractMultiOutputDistribution]
+    ) -> Union[np.ndarray, List[np.ndarray]]:
         """Beta values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
@@ -583,31 +585,26 @@ class ConvNP(DeepSensorModel):
             Bernoulli-Gamma likelihood.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Beta values.
         """
-        dist = self(task)
-        return self.beta(dist)
-
-    @dispatch
-    def k(
-        self, dist: AbstractMultiOutputDistribution
-    ) -> Union[np.ndarray, List[np.ndarray]]:
-        if self.config["likelihood"] not in ["bernoulli-gamma"]:
+        if self.config["likelihood"] not in ["spikes-beta"]:
             raise NotImplementedError(
-                f"ConvNP.k method not supported for likelihood {self.config['likelihood']}. "
-                f"Valid likelihoods: 'bernoulli-gamma'."
+                f"ConvNP.beta method not supported for likelihood {self.config['likelihood']}. "
+                f"Valid likelihoods: 'spikes-beta'."
             )
-        k = dist.slab.k
-        k = self._cast_numpy_and_squeeze(k)
-        return self._maybe_concat_multi_targets(k)
+        beta = self._get_dist(task).slab.beta
+        beta = self._cast_numpy_and_squeeze(beta)
+        return self._maybe_concat_multi_targets(beta)
 
-    @dispatch
-    def k(self, task: Task) -> Union[np.ndarray, List[np.ndarray]]:
+    def k(
+        self, task: Union[Task, AbstractMultiOutputDistribution]
+    ) -> Union[np.ndarray, List[np.ndarray]]:
         """K parameter values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
@@ -619,31 +616,26 @@ class ConvNP(DeepSensorModel):
             the slab component of the mixture model.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 k values.
         """
-        dist = self(task)
-        return self.k(dist)
-
-    @dispatch
-    def scale(
-        self, dist: AbstractMultiOutputDistribution
-    ) -> Union[np.ndarray, List[np.ndarray]]:
         if self.config["likelihood"] not in ["bernoulli-gamma"]:
             raise NotImplementedError(
-                f"ConvNP.scale method not supported for likelihood {self.config['likelihood']}. "
+                f"ConvNP.k method not supported for likelihood {self.config['likelihood']}. "
                 f"Valid likelihoods: 'bernoulli-gamma'."
             )
-        scale = dist.slab.scale
-        scale = self._cast_numpy_and_squeeze(scale)
-        return self._maybe_concat_multi_targets(scale)
+        k = self._get_dist(task).slab.k
+        k = self._cast_numpy_and_squeeze(k)
+        return self._maybe_concat_multi_targets(k)
 
-    @dispatch
-    def scale(self, task: Task) -> Union[np.ndarray, List[np.ndarray]]:
+    def scale(
+        self, task: Union[Task, AbstractMultiOutputDistribution]
+    ) -> Union[np.ndarray, List[np.ndarray]]:
         """Scale parameter values of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_features, *N_targets)``.
@@ -655,89 +647,77 @@ class ConvNP(DeepSensorModel):
             the slab component of the mixture model.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Scale values.
         """
-        dist = self(task)
-        return self.scale(dist)
-
-    @dispatch
-    def mixture_probs(self, dist: AbstractMultiOutputDistribution):
-        if self.N_mixture_components == 1:
+        if self.config["likelihood"] not in ["bernoulli-gamma"]:
             raise NotImplementedError(
-                f"mixture_probs not supported if model attribute N_mixture_components == 1. "
-                f"Try changing the likelihood to a mixture model, e.g. 'spikes-beta'."
+                f"ConvNP.scale method not supported for likelihood {self.config['likelihood']}. "
+                f"Valid likelihoods: 'bernoulli-gamma'."
             )
-        mixture_probs = dist.logprobs
-        mixture_probs = self._cast_numpy_and_squeeze(mixture_probs)
-        mixture_probs = self._maybe_concat_multi_targets(mixture_probs)
-        if isinstance(mixture_probs, (list, tuple)):
-            return [np.moveaxis(np.exp(m), -1, 0) for m in mixture_probs]
-        else:
-            return np.moveaxis(np.exp(mixture_probs), -1, 0)
+        scale = self._get_dist(task).slab.scale
+        scale = self._cast_numpy_and_squeeze(scale)
+        return self._maybe_concat_multi_targets(scale)
 
-    @dispatch
-    def mixture_probs(self, task: Task):
+    def mixture_probs(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Mixture probabilities of model's distribution at target locations in task.
 
         Returned numpy arrays have shape ``(N_components, N_features, *N_targets)``.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task containing the context and target data.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 Mixture probabilities.
         """
-        dist = self(task)
-        return self.mixture_probs(dist)
-
-    @dispatch
-    def covariance(self, dist: AbstractMultiOutputDistribution):
-        return B.to_numpy(B.dense(dist.vectorised_normal.var))[0, 0]
+        if self.N_mixture_components == 1:
+            raise NotImplementedError(
+                f"mixture_probs not supported if model attribute N_mixture_components == 1. "
+                f"Try changing the likelihood to a mixture model, e.g. 'spikes-beta'."
+            )
+        mixture_probs = self._get_dist(task).logprobs
+        mixture_probs = self._cast_numpy_and_squeeze(mixture_probs)
+        mixture_probs = self._maybe_concat_multi_targets(mixture_probs)
+        if isinstance(mixture_probs, (list, tuple)):
+            return [np.moveaxis(np.exp(m), -1, 0) for m in mixture_probs]
+        else:
+            return np.moveaxis(np.exp(mixture_probs), -1, 0)
 
-    @dispatch
-    def covariance(self, task: Task):
+    def covariance(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """...
 
         Args:
-            task (:class:`~.data.task.Task`):
-                ...
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             ...: ...
         """
-        dist = self(task)
-        return self.covariance(dist)
+        dist = self._get_dist(task)
+        return B.to_numpy(B.dense(dist.vectorised_normal.var))[0, 0]
 
-    @dispatch
     def sample(
         self,
-        dist: AbstractMultiOutputDistribution,
+        task: Union[Task, AbstractMultiOutputDistribution],
         n_samples: int = 1,
     ):
-        if self.config["likelihood"] in ["gnp", "lowrank"]:
-            samples = dist.noiseless.sample(n_samples)
-        else:
-            samples = dist.sample(n_samples)
-        # Be careful to keep sample dimension in position 0
-        samples = self._cast_numpy_and_squeeze(samples, squeeze_axes=(1, 2))
-        return self._maybe_concat_multi_targets(samples, concat_axis=1)
-
-    @dispatch
-    def sample(self, task: Task, n_samples: int = 1):
         """Create samples from a ConvNP distribution.
 
         Returned numpy arrays have shape ``(N_samples, N_features, *N_targets)``,
 
         Args:
-            dist (neuralprocesses.dist.AbstractMultiOutputDistribution):
-                The distribution to sample from.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
             n_samples (int, optional):
                 The number of samples to draw from the distribution, by
                 default 1.
@@ -746,8 +726,14 @@ class ConvNP(DeepSensorModel):
             :class:`numpy:numpy.ndarray` | List[:class:`numpy:numpy.ndarray`]:
                 The samples as an array or list of arrays.
         """
-        dist = self(task)
-        return self.sample(dist, n_samples)
+        dist = self._get_dist(task)
+        if self.config["likelihood"] in ["gnp", "lowrank"]:
+            samples = dist.noiseless.sample(n_samples)
+        else:
+            samples = dist.sample(n_samples)
+        # Be careful to keep sample dimension in position 0
+        samples = self._cast_numpy_and_squeeze(samples, squeeze_axes=(1, 2))
+        return self._maybe_concat_multi_targets(samples, concat_axis=1)
 
     @dispatch
     def slice_diag(self, task: Task):
@@ -794,27 +780,13 @@ class ConvNP(DeepSensorModel):
             )
         return dist_diag
 
-    @dispatch
-    def mean_marginal_entropy(self, dist: AbstractMultiOutputDistribution):
-        """Mean marginal entropy over target points given context points.
-
-        Args:
-            dist (neuralprocesses.dist.AbstractMultiOutputDistribution):
-                The distribution to compute the entropy of.
-
-        Returns:
-            float: The mean marginal entropy.
-        """
-        dist_diag = self.slice_diag(dist)
-        return B.mean(B.to_numpy(dist_diag.entropy())[0, 0])
-
-    @dispatch
-    def mean_marginal_entropy(self, task: Task):
+    def mean_marginal_entropy(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Mean marginal entropy over target points given context points.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task to compute the entropy of.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             float: The mean marginal entropy.
@@ -822,73 +794,53 @@ class ConvNP(DeepSensorModel):
         dist_diag = self.slice_diag(task)
         return B.mean(B.to_numpy(dist_diag.entropy())[0, 0])
 
-    @dispatch
-    def joint_entropy(self, dist: AbstractMultiOutputDistribution):
-        """Model entropy over target points given context points.
-
-        Args:
-            dist (neuralprocesses.dist.AbstractMultiOutputDistribution):
-                The distribution to compute the entropy of.
-
-        Returns:
-            float: The model entropy.
-        """
-        return B.to_numpy(dist.entropy())[0, 0]
-
-    @dispatch
-    def joint_entropy(self, task: Task):
+    def joint_entropy(self, task: Union[Task, AbstractMultiOutputDistribution]):
         """Model entropy over target points given context points.
 
         Args:
-            task (:class:`~.data.task.Task`):
-                The task to compute the entropy of.
+            task (:class:`~.data.task.Task` | neuralprocesses.dist.AbstractMultiOutputDistribution):
+                The task containing the context and target data, or the
+                model's distribution for it.
 
         Returns:
             float: The model entropy.
         """
-        return B.to_numpy(self(task).entropy())[0, 0]
+        return B.to_numpy(self._get_dist(task).entropy())[0, 0]
 
-    @dispatch
-    def logpdf(self, dist: AbstractMultiOutputDistribution, task: Task):
+    def logpdf(
+        self,
+        dist: Union[AbstractMultiOutputDistribution, Task],
+        task: Optional[Task] = None,
+    ):
         """Joint logpdf over all target sets.
 
+        Can be called as ``logpdf(task)``, or as ``logpdf(dist, task)`` with
+        the model's distribution for ``task`` to avoid repeating the forward
+        pass.
+
         .. note::
             If the model has multiple target sets, the returned logpdf is the
             mean logpdf over all target sets.
 
         Args:
-            dist (neuralprocesses.dist.AbstractMultiOutputDistribution):
-                The distribution to compute the logpdf of.
-            task (:class:`~.data.task.Task`):
+            dist (neuralprocesses.dist.AbstractMultiOutputDistribution | :class:`~.data.task.Task`):
+                The distribution to compute the logpdf of, or the task if
+                ``task`` is not given.
+            task (:class:`~.data.task.Task`, optional):
                 The task to compute the logpdf of.
 
         Returns:
             float: The logpdf.
         """
+        if task is None:
+            task = dist
+            dist = self(task)
         # Need to ensure `Y_t` is a tensor and, if multiple target sets,
         #   an nps.Aggregate object
         task = ConvNP.modify_task(task)
         _, _, Y_t, _ = convert_task_to_nps_args(task)
         return B.to_numpy(dist.logpdf(Y_t)).mean()
 
-    @dispatch
-    def logpdf(self, task: Task):
-        """Joint logpdf over all target sets.
-
-        .. note::
-            If the model has multiple target sets, the returned logpdf is the
-            mean logpdf over all target sets.
-
-        Args:
-            task (:class:`~.data.task.Task`):
-                The task to compute the logpdf of.
-
-        Returns:
-            float: The logpdf.
-        """
-        dist = self(task)
-        return self.logpdf(dist, task)
-
     def loss_fn(
         self,
         task: Task,
@@ -979,8 +931,8 @@ class ConvNP(DeepSensorModel):
             )
 
         # AR sampling requires gridded data to be flattened, not coordinate tuples
-        task_arsample = copy.deepcopy(task)
-        task = copy.deepcopy(task)
+        task_arsample = task.shallow_copy(X_t=list(task["X_t"]))
+        task = task.shallow_copy()
 
         if X_target_AR is not None:
             # User has specified a set of locations to draw AR samples over
@@ -998,13 +950,15 @@ class ConvNP(DeepSensorModel):
                 xt = xt[..., ::ar_subsample_factor]
             task_arsample["X_t"][0] = xt
         else:
-            task_arsample = copy.deepcopy(task)
+            task_arsample = task.shallow_copy()
 
         task = task.flatten_gridded_data()
         task_arsample = task_arsample.flatten_gridded_data()
 
+        # Keep the unmodified AR target locations for conditioning on the AR samples
+        X_t_ar = task_arsample["X_t"][0]
+
         task_arsample = ConvNP.modify_task(task_arsample)
-        task = ConvNP.modify_task(task)
 
         if backend.str == "torch":
             import torch
@@ -1030,14 +984,34 @@ class ConvNP(DeepSensorModel):
 
         if ar_subsample_factor > 1 or X_target_AR is not None:
             # AR sample locations not equal to target locations - infill the rest of the
-            # sample with the model mean conditioned on the AR samples
+            # sample with the model mean conditioned on the AR samples.
+            # Only the sample values change between samples, so extend context
+            #   set 0 with the AR sample locations once and overwrite the suffix
+            #   of Y_c for each sample
+            X_c, Y_c = task["X_c"][0], task["Y_c"][0]
+            n_c = X_c.shape[-1]
+            X_c_ext = np.concatenate([X_c, X_t_ar], axis=-1)
+            Y_c_ext = np.empty(
+                (*Y_c.shape[:-1], n_c + X_t_ar.shape[-1]),
+                dtype=np.result_type(Y_c, noiseless_samples),
+            )
+            Y_c_ext[..., :n_c] = Y_c
+
+            # Convert the task, with the extended context locations, once. Only
+            #   the values of context set 0 are converted for each sample
+            task_modified = ConvNP.modify_task(
+                task.shallow_copy(X_c=[X_c_ext, *task["X_c"][1:]])
+            )
+
             full_samples = []
             for sample in noiseless_samples:
-                task_with_sample = copy.deepcopy(task)
-                task_with_sample["X_c"][0] = B.concat(
-                    task["X_c"][0], task_arsample["X_t"][0], axis=-1
+                Y_c_ext[..., n_c:] = sample[0]  # Slice out batch dim
+                Y_c_modified = ConvNP.modify_task(
+                    Task({"Y_c": [Y_c_ext], "ops": list(task["ops"])})
+                )["Y_c"][0]
+                task_with_sample = task_modified.shallow_copy(
+                    Y_c=[Y_c_modified, *task_modified["Y_c"][1:]]
                 )
-                task_with_sample["Y_c"][0] = B.concat(task["Y_c"][0], sample, axis=-1)
 
                 if fill_type == "mean":
                     # Compute the mean conditioned on the AR samples
@@ -32,8 +32,13 @@ def compute_greatest_data_density(task_loader: TaskLoader) -> int:
     """
     # List of data resolutions for each context/target variable (in points-per-unit)
     data_densities = []
+    # Data resolution for each unique variable object, as the same data is often
+    #   used for both context and target sets
+    data_resolutions = {}
     for var in [*task_loader.context, *task_loader.target]:
-        if isinstance(var, (xr.DataArray, xr.Dataset)):
+        if id(var) in data_resolutions:
+            data_resolution = data_resolutions[id(var)]
+        elif isinstance(var, (xr.DataArray, xr.Dataset)):
             # Gridded variable: use data resolution
             data_resolution = compute_xarray_data_resolution(var)
         elif isinstance(var, (pd.DataFrame, pd.Series)):
@@ -43,6 +48,7 @@ def compute_greatest_data_density(task_loader: TaskLoader) -> int:
             )
         else:
             raise ValueError(f"Unknown context input type: {type(var)}")
+        data_resolutions[id(var)] = data_resolution
         data_density = int(1 / data_resolution)
         data_densities.append(data_density)
     max_density = int(max(data_densities))
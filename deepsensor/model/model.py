@@ -10,7 +10,7 @@ from deepsensor.model.pred import (
     increase_spatial_resolution,
     infer_prediction_modality_from_X_t,
 )
-from deepsensor.data.task import Task
+from deepsensor.data.task import Task, group_tasks_into_batches, stack_tasks
 
 from typing import List, Union, Optional, Tuple
 import copy
@@ -240,6 +240,7 @@ class DeepSensorModel(ProbabilisticModel):
         seed: int = 0,
         append_indexes: dict = None,
         progress_bar: int = 0,
+        batch_size: int = 1,
         verbose: bool = False,
     ) -> Prediction:
         """Predict on a regular grid or at off-grid locations.
@@ -286,6 +287,12 @@ class DeepSensorModel(ProbabilisticModel):
                 off-grid case. Default ``None``.
             progress_bar (int):
                 Whether to display a progress bar over tasks. Default 0.
+            batch_size (int):
+                Maximum number of tasks to run through the model in a single
+                forward pass. Tasks are only batched together if they have the
+                same number of context points. Batching is not supported for
+                AR sampling, multiple target sets, or ``"mixture_probs"``, in
+                which case tasks are run one at a time. Default 1.
             verbose (bool):
                 Whether to print time taken for prediction. Default ``False``.
 
@@ -512,7 +519,7 @@ class DeepSensorModel(ProbabilisticModel):
             else:
                 aux_at_targets = self.task_loader.aux_at_targets
 
-        for task in tqdm(tasks, position=0, disable=progress_bar < 1, leave=True):
+        for task in tasks:
             task["X_t"] = [X_t_arr for _ in range(len(self.task_loader.target_var_IDs))]
 
             # If passing auxiliary data, need to sample it at target locations
@@ -524,29 +531,29 @@ class DeepSensorModel(ProbabilisticModel):
                     X_t_arr, aux_at_targets_sliced
                 )
 
-            prediction_arrs = {}
-            prediction_methods = {}
-            for param in pred_params:
-                try:
-                    method = getattr(self, param)
-                    prediction_methods[param] = method
-                except AttributeError:
-                    raise AttributeError(
-                        f"Prediction method {param} not found in model class."
-                    )
-            if n_samples >= 1:
-                B.set_random_seed(seed)
-                np.random.seed(seed)
-                if ar_sample:
-                    sample_method = getattr(self, "ar_sample")
-                    sample_args = {
-                        "n_samples": n_samples,
-                        "ar_subsample_factor": ar_subsample_factor,
-                    }
-                else:
-                    sample_method = getattr(self, "sample")
-                    sample_args = {"n_samples": n_samples}
+        prediction_methods = {}
+        for param in pred_params:
+            try:
+                method = getattr(self, param)
+                prediction_methods[param] = method
+            except AttributeError:
+                raise AttributeError(
+                    f"Prediction method {param} not found in model class."
+                )
+        if n_samples >= 1:
+            if ar_sample:
+                sample_method = getattr(self, "ar_sample")
+                sample_args = {
+                    "n_samples": n_samples,
+                    "ar_subsample_factor": ar_subsample_factor,
+                }
+            else:
+                sample_method = getattr(self, "sample")
+                sample_args = {"n_samples": n_samples}
 
+        def run_model(task):
+            """Compute the prediction arrays for a single task."""
+            prediction_arrs = {}
             # If `DeepSensor` model child has been sub-classed with a `__call__` method,
             # we assume this is a distribution-like object that can be used to compute
             # mean, std and samples. Otherwise, run the model with `Task` for each prediction type.
@@ -577,67 +584,108 @@ class DeepSensorModel(ProbabilisticModel):
                             (n_samples, len(target_var_IDs), *target_shape)
                         )
                     prediction_arrs["samples"] = samples_arr
+            return prediction_arrs
+
+        def run_model_batched(task_batch):
+            """Compute the prediction arrays for a batch of tasks with one forward pass."""
+            dist = self(stack_tasks(task_batch), n_samples=n_samples)
+            batch_prediction_arrs = {}
+            for param, method in prediction_methods.items():
+                # Shape (N_batch, N_features, *N_targets)
+                batch_prediction_arrs[param] = method(dist)
+            if n_samples >= 1:
+                # Shape (N_samples, N_batch, N_features, *N_targets)
+                batch_prediction_arrs["samples"] = sample_method(dist, **sample_args)
+            return [
+                {
+                    param: arr[:, i] if param == "samples" else arr[i]
+                    for param, arr in batch_prediction_arrs.items()
+                }
+                for i in range(len(task_batch))
+            ]
+
+        # Batching is only supported for models that return a distribution object, and
+        #   for outputs that are arrays with a leading batch dimension
+        batching_supported = (
+            hasattr(self, "__call__")
+            and not ar_sample
+            and len(self.task_loader.target_var_IDs) == 1
+            and "mixture_probs" not in pred_params
+        )
+        if batch_size > 1 and batching_supported:
+            task_batches = group_tasks_into_batches(tasks, batch_size)
+        else:
+            task_batches = [[task] for task in tasks]
 
-            # Concatenate multi-target predictions
-            for param, arr in prediction_arrs.items():
-                if isinstance(arr, (list, tuple)):
-                    if param != "samples":
-                        concat_axis = 0
-                    elif param == "samples":
-                        # Axis 0 is sample dim, axis 1 is variable dim
-                        concat_axis = 1
-                    prediction_arrs[param] = np.concatenate(arr, axis=concat_axis)
-
-            # Unnormalise predictions
-            for param, arr in prediction_arrs.items():
-                # TODO make class attributes?
-                scale_and_offset_params = ["mean"]
-                scale_only_params = ["std"]
-                scale_squared_only_params = ["variance"]
-                if unnormalise:
-                    if param == "samples":
-                        for sample_i in range(n_samples):
-                            prediction_arrs["samples"][sample_i] = (
-                                unnormalise_pred_array(
-                                    prediction_arrs["samples"][sample_i]
+        for task_batch in tqdm(
+            task_batches, position=0, disable=progress_bar < 1, leave=True
+        ):
+            if len(task_batch) > 1:
+                prediction_arrs_batch = run_model_batched(task_batch)
+            else:
+                prediction_arrs_batch = [run_model(task_batch[0])]
+
+            for task, prediction_arrs in zip(task_batch, prediction_arrs_batch):
+                # Concatenate multi-target predictions
+                for param, arr in prediction_arrs.items():
+                    if isinstance(arr, (list, tuple)):
+                        if param != "samples":
+                            concat_axis = 0
+                        elif param == "samples":
+                            # Axis 0 is sample dim, axis 1 is variable dim
+                            concat_axis = 1
+                        prediction_arrs[param] = np.concatenate(arr, axis=concat_axis)
+
+                # Unnormalise predictions
+                for param, arr in prediction_arrs.items():
+                    # TODO make class attributes?
+                    scale_and_offset_params = ["mean"]
+                    scale_only_params = ["std"]
+                    scale_squared_only_params = ["variance"]
+                    if unnormalise:
+                        if param == "samples":
+                            for sample_i in range(n_samples):
+                                prediction_arrs["samples"][sample_i] = (
+                                    unnormalise_pred_array(
+                                        prediction_arrs["samples"][sample_i]
+                                    )
                                 )
+                        elif param in scale_and_offset_params:
+                            prediction_arrs[param] = unnormalise_pred_array(arr)
+                        elif param in scale_only_params:
+                            prediction_arrs[param] = unnormalise_pred_array(
+                                arr, add_offset=False
                             )
-                    elif param in scale_and_offset_params:
-                        prediction_arrs[param] = unnormalise_pred_array(arr)
-                    elif param in scale_only_params:
-                        prediction_arrs[param] = unnormalise_pred_array(
-                            arr, add_offset=False
-                        )
-                    elif param in scale_squared_only_params:
-                        # This is a horrible hack to repeat the scaling operation of the linear
-                        #   transform twice s.t. new_var = scale ^ 2 * var
-                        prediction_arrs[param] = unnormalise_pred_array(
-                            arr, add_offset=False
-                        )
-                        prediction_arrs[param] = unnormalise_pred_array(
-                            prediction_arrs[param], add_offset=False
-                        )
-                    else:
-                        # Assume prediction parameters not captured above are dimensionless
-                        #   quantities like probabilities and should not be unnormalised
-                        pass
-
-            # Assign predictions to Prediction object
-            for param, arr in prediction_arrs.items():
-                if param != "mixture_probs":
-                    pred.assign(param, task["time"], arr, lead_times=lead_times)
-                elif param == "mixture_probs":
-                    assert arr.shape[0] == self.N_mixture_components, (
-                        f"Number of mixture components ({arr.shape[0]}) does not match "
-                        f"model attribute N_mixture_components ({self.N_mixture_components})."
-                    )
-                    for component_i, probs in enumerate(arr):
-                        pred.assign(
-                            f"{param}_{component_i}",
-                            task["time"],
-                            probs,
-                            lead_times=lead_times,
+                        elif param in scale_squared_only_params:
+                            # This is a horrible hack to repeat the scaling operation of the linear
+                            #   transform twice s.t. new_var = scale ^ 2 * var
+                            prediction_arrs[param] = unnormalise_pred_array(
+                                arr, add_offset=False
+                            )
+                            prediction_arrs[param] = unnormalise_pred_array(
+                                prediction_arrs[param], add_offset=False
+                            )
+                        else:
+                            # Assume prediction parameters not captured above are dimensionless
+                            #   quantities like probabilities and should not be unnormalised
+                            pass
+
+                # Assign predictions to Prediction object
+                for param, arr in prediction_arrs.items():
+                    if param != "mixture_probs":
+                        pred.assign(param, task["time"], arr, lead_times=lead_times)
+                    elif param == "mixture_probs":
+                        assert arr.shape[0] == self.N_mixture_components, (
+                            f"Number of mixture components ({arr.shape[0]}) does not match "
+                            f"model attribute N_mixture_components ({self.N_mixture_components})."
                         )
+                        for component_i, probs in enumerate(arr):
+                            pred.assign(
+                                f"{param}_{component_i}",
+                                task["time"],
+                                probs,
+                                lead_times=lead_times,
+                            )
 
         if forecasting_mode:
             pred = add_valid_time_coord_to_pred_and_move_time_dims(pred)
@@ -86,6 +86,13 @@ class Prediction(dict):
 
         # Create empty xarray/pandas objects to store predictions
         if self.mode == "on-grid":
+            # Map from time/lead time coordinate values to integer indexes, for writing
+            #   predictions directly into the underlying arrays in `assign`
+            self._time_index = {date: i for i, date in enumerate(pd.to_datetime(dates))}
+            if self.forecasting_mode:
+                self._lead_time_index = {
+                    pd.Timedelta(lt): i for i, lt in enumerate(lead_times)
+                }
             for var_ID in self.target_var_IDs:
                 if self.forecasting_mode:
                     prepend_dims = ["lead_time"]
@@ -169,31 +176,31 @@ class Prediction(dict):
             assert len(lead_times) == data.shape[0], msg
 
         if self.mode == "on-grid":
+            date_i = self._time_index[pd.Timestamp(date)]
+            if self.forecasting_mode:
+                indexes = [
+                    (self._lead_time_index[pd.Timedelta(lt)], date_i)
+                    for lt in lead_times
+                ]
+            else:
+                indexes = [date_i] * len(self.target_var_IDs)
+            mask = self.X_t_mask.data
+
             if prediction_parameter != "samples":
-                for i, (var_ID, pred) in enumerate(zip(self.target_var_IDs, data)):
-                    if self.forecasting_mode:
-                        index = (lead_times[i], date)
-                    else:
-                        index = date
-                    self[var_ID][prediction_parameter].loc[index].data[
-                        self.X_t_mask.data
-                    ] = pred.ravel()
+                for var_ID, pred, index in zip(self.target_var_IDs, data, indexes):
+                    self[var_ID][prediction_parameter].data[index][mask] = pred.ravel()
             elif prediction_parameter == "samples":
                 assert len(data.shape) == 4, (
                     f"If prediction_parameter is 'samples', and mode is 'on-grid', data must"
                     f"have shape (N_samples, N_var, N_x1, N_x2). Got {data.shape}."
                 )
                 for sample_i, sample in enumerate(data):
-                    for i, (var_ID, pred) in enumerate(
-                        zip(self.target_var_IDs, sample)
+                    for var_ID, pred, index in zip(
+                        self.target_var_IDs, sample, indexes
                     ):
-                        if self.forecasting_mode:
-                            index = (lead_times[i], date)
-                        else:
-                            index = date
-                        self[var_ID][f"sample_{sample_i}"].loc[index].data[
-                            self.X_t_mask.data
-                        ] = pred.ravel()
+                        self[var_ID][f"sample_{sample_i}"].data[index][mask] = (
+                            pred.ravel()
+                        )
 
         elif self.mode == "off-grid":
             if prediction_parameter != "samples":
@@ -293,9 +300,16 @@ def create_empty_spatiotemporal_xarray(
         coord_names["x2"]: x2_predict,
     }
 
+    # Preallocate float32 arrays rather than letting xarray allocate float64 NaN
+    #   arrays that then need to be cast
+    shape = tuple(len(coords[dim]) for dim in dims)
     pred_ds = xr.Dataset(
-        {data_var: xr.DataArray(dims=dims, coords=coords) for data_var in data_vars}
-    ).astype("float32")
+        {
+            data_var: (dims, np.full(shape, np.nan, dtype=np.float32))
+            for data_var in data_vars
+        },
+        coords=coords,
+    )
 
     # Convert time coord to pandas timestamps
     pred_ds = pred_ds.assign_coords(time=pd.to_datetime(pred_ds.time.values))
@@ -16,9 +16,29 @@ clear_all_cache()
 from .. import *  # noqa
 
 
-def convert_to_tensor(arr):
-    """Convert `arr` to pytorch tensor."""
-    return torch.tensor(arr)
+# Arrays smaller than this are copied to the device without pinning host memory first
+_PIN_MEMORY_MIN_BYTES = 1 << 16
+
+
+def convert_to_tensor(arr, device=None):
+    """Convert `arr` to pytorch tensor.
+
+    Numpy arrays are converted without copying where possible. If ``device``
+    (defaulting to ``backend.device``) is set, the tensor is moved to it with a
+    non-blocking copy, from pinned host memory for large CUDA transfers.
+    """
+    if device is None:
+        device = backend.device
+    if device is None:
+        return torch.as_tensor(arr)
+
+    device = torch.device(device)
+    if isinstance(arr, torch.Tensor):
+        return arr.to(device, non_blocking=True)
+    tensor = torch.as_tensor(arr, device="cpu")
+    if device.type == "cuda" and tensor.nbytes >= _PIN_MEMORY_MIN_BYTES:
+        tensor = tensor.pin_memory()
+    return tensor.to(device, non_blocking=True)
 
 
 from .. import config as deepsensor_config
@@ -27,6 +47,7 @@ from .. import backend
 backend.nps = nps
 backend.model = torch.nn.Module
 backend.convert_to_tensor = convert_to_tensor
+backend.device = None
 backend.str = "torch"
 
 B.epsilon = deepsensor_config.DEFAULT_LAB_EPSILON
@@ -31,6 +31,7 @@ def set_gpu_default_device() -> None:
             # Set default GPU device
             torch.set_default_device("cuda")
             B.set_global_device("cuda:0")
+            deepsensor.backend.device = "cuda"
         else:
             raise RuntimeError("No GPU available: torch.cuda.is_available() == False")
     elif deepsensor.backend.str == "tf":
@@ -111,6 +111,59 @@ class TestActiveLearning(unittest.TestCase):
                 importances = acquisition_fn(task, X_s_arr)
                 assert importances.size == X_s_arr.shape[-1]
 
+    def test_expected_improvement_many_search_points(self):
+        """Check EI over enough search points to use the fused kernel matches numpy"""
+        from scipy.special import ndtr
+
+        task = self.task_loader("2014-12-31", context_sampling=10)
+        rng = np.random.default_rng(0)
+        X_s_arr = rng.uniform(0, 1, size=(2, 5000)).astype(np.float32)
+
+        acquisition_fn = ExpectedImprovement(self.model)
+        importances = acquisition_fn(task, X_s_arr)
+
+        task_s = task.shallow_copy(X_t=X_s_arr)
+        mean = self.model.mean(task_s)[0]
+        stddev = self.model.stddev(task_s)[0]
+        improvement = mean - task["Y_c"][0].max()
+        Z = improvement / stddev
+        expected = stddev * (
+            improvement * ndtr(Z) + np.exp(-0.5 * Z**2) / np.sqrt(2 * np.pi)
+        )
+
+        assert importances.shape == expected.shape
+        np.testing.assert_allclose(importances, expected, rtol=1e-4, atol=1e-5)
+
+    def test_context_dist_many_context_points(self):
+        """Check ContextDist with enough context points to use the matrix product
+        path matches the broadcast distances, including close to sensors
+        """
+        task = self.task_loader("2014-12-31", context_sampling=20)
+        X_c = task["X_c"][0]
+        assert X_c.dtype == np.float32 and X_c.shape[1] >= 16
+
+        rng = np.random.default_rng(0)
+        X_s_arr = np.concatenate(
+            [X_c + 1e-4, rng.uniform(0, 1, size=(2, 50))], axis=1
+        ).astype(np.float32)
+
+        dists = ContextDist(self.model)(task, X_s_arr)
+
+        X_s_64, X_c_64 = X_s_arr.astype(np.float64), X_c.astype(np.float64)
+        expected = np.linalg.norm(
+            X_s_64[..., np.newaxis] - X_c_64[..., np.newaxis, :], axis=0
+        ).min(axis=1)
+        np.testing.assert_allclose(dists, expected, rtol=1e-6, atol=1e-9)
+
+    def test_expected_improvement_without_context_returns_stddev(self):
+        """Check EI falls back to the predictive stddev with no context observations"""
+        task = self.task_loader("2014-12-31", context_sampling=0)
+        X_s_arr = np.random.default_rng(0).uniform(0, 1, size=(2, 20))
+
+        importances = ExpectedImprovement(self.model)(task, X_s_arr)
+        expected = self.model.stddev(task.shallow_copy(X_t=X_s_arr))[0]
+        np.testing.assert_allclose(importances, expected)
+
     def test_greedy_alg_runs(self):
         """Run the greedy algorithm to check that it runs without error"""
         # Both a sequential and parallel acquisition function
@@ -391,6 +391,30 @@ class TestModel(unittest.TestCase):
         # Check that nothing breaks
         model(task)
 
+    def test_nans_masked_in_large_gridded_context(self):
+        """Test NaN masking of context arrays large enough to use the fused
+        NaN-masking kernel matches ``np.ma.fix_invalid``.
+        """
+        da = _gen_data_xr(
+            coords=dict(
+                time=pd.date_range("2020-01-01", "2020-01-02", freq="D"),
+                x1=np.linspace(0, 1, 150),
+                x2=np.linspace(0, 1, 120),
+            )
+        )
+        tl = TaskLoader(context=da, target=self.da)
+        task = tl("2020-01-01", context_sampling="all", target_sampling=10)
+        task["Y_c"][0][0, 0, 0] = np.nan
+        task["Y_c"][0][0, 1, 1] = np.inf
+
+        # float16 has no kernel implementation, so it must fall back to numpy
+        for dtype in [np.float32, np.float64, np.float16]:
+            task_dtype = task.shallow_copy(Y_c=[task["Y_c"][0].astype(dtype)])
+            masked_task = task_dtype.add_batch_dim().mask_nans_numpy()
+            expected = np.ma.fix_invalid(task_dtype["Y_c"][0][None], fill_value=0.0)
+            np.testing.assert_array_equal(masked_task["Y_c"][0].data, expected.data)
+            np.testing.assert_array_equal(masked_task["Y_c"][0].mask, expected.mask)
+
     def test_highlevel_predict_coords_align_with_X_t_ongrid(self):
         """Test coordinates of the xarray returned predictions align with the
         coordinates of X_t.
@@ -556,6 +580,95 @@ class TestModel(unittest.TestCase):
         with self.assertRaises(AttributeError):
             model.predict(task, X_t=self.da, pred_params=["invalid_param"])
 
+    def test_highlevel_predict_batched_matches_unbatched(self):
+        """Test that batching tasks in ``.predict`` gives the same predictions
+        as running tasks one at a time.
+        """
+        tl = TaskLoader(context=self.da, target=self.da)
+        model = ConvNP(self.dp, tl, unet_channels=(5, 5, 5), verbose=False)
+        dates = pd.date_range("2020-01-01", "2020-01-05")
+        tasks = tl(dates, context_sampling=10)
+        # Task with a different number of context points can't be stacked with the others
+        tasks[2] = tl(dates[2], context_sampling=20)
+
+        pred = model.predict(tasks, X_t=self.da)
+        pred_batched = model.predict(tasks, X_t=self.da, batch_size=3)
+
+        for param in ["mean", "std"]:
+            np.testing.assert_allclose(
+                pred[self.var_ID][param].values,
+                pred_batched[self.var_ID][param].values,
+                atol=1e-5,
+            )
+
+    def test_in_place_task_edits_used_after_forward_pass(self):
+        """Test that editing a task's arrays in place after a forward pass changes
+        the next prediction.
+        """
+        tl = TaskLoader(context=self.da, target=self.da)
+        model = ConvNP(self.dp, tl, unet_channels=(5, 5, 5), verbose=False)
+        task = tl("2020-01-01", context_sampling=10, target_sampling=10)
+
+        mean_before = model.mean(task)
+        task["Y_c"][0][:] = 5.0
+        mean_after = model.mean(task)
+
+        fresh_task = copy.deepcopy(task)
+        np.testing.assert_allclose(mean_after, model.mean(fresh_task), rtol=1e-5)
+        assert not np.allclose(mean_before, mean_after)
+
+    def test_methods_accept_task_or_dist(self):
+        """Test that prediction methods give the same result when passed a task
+        or the model's distribution for that task.
+        """
+        tl = TaskLoader(context=self.da, target=self.da)
+        model = ConvNP(self.dp, tl, unet_channels=(5, 5, 5), verbose=False)
+        task = tl("2020-01-01", context_sampling=10, target_sampling=10)
+        dist = model(task)
+
+        for method in [model.mean, model.variance, model.std]:
+            np.testing.assert_allclose(method(dist), method(task), rtol=1e-5)
+        # The std computed in place from a task matches the variance
+        np.testing.assert_allclose(
+            model.std(task), np.sqrt(model.variance(task)), rtol=1e-5
+        )
+        # Computing the std from a distribution must not overwrite its variance
+        np.testing.assert_allclose(
+            model.variance(dist), model.std(dist) ** 2, rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            model.logpdf(dist, task), model.logpdf(task), rtol=1e-5
+        )
+        assert model.sample(dist, n_samples=2).shape == (2, 1, 10)
+
+    def test_data_informed_defaults_follow_replaced_data(self):
+        """Test that a model built after replacing a ``TaskLoader``'s data infers
+        its defaults from the new data.
+        """
+        da_fine = _gen_data_xr(
+            coords=dict(
+                time=pd.date_range("2020-01-01", "2020-01-02", freq="D"),
+                x1=np.linspace(0, 1, 90),
+                x2=np.linspace(0, 1, 60),
+            )
+        )
+        tl_fine = TaskLoader(context=da_fine, target=da_fine)
+        model_fresh = ConvNP(self.dp, tl_fine, unet_channels=(5, 5, 5), verbose=False)
+
+        tl = TaskLoader(context=self.da, target=self.da)
+        model_coarse = ConvNP(self.dp, tl, unet_channels=(5, 5, 5), verbose=False)
+
+        tl.context = tl_fine.context
+        tl.target = tl_fine.target
+        model_fine = ConvNP(self.dp, tl, unet_channels=(5, 5, 5), verbose=False)
+
+        for key in ["internal_density", "encoder_scales", "decoder_scale"]:
+            assert model_fine.config[key] == model_fresh.config[key]
+        assert (
+            model_fine.config["internal_density"]
+            > model_coarse.config["internal_density"]
+        )
+
     def test_saving_and_loading(self):
         """Test saving and loading of model"""
         with tempfile.TemporaryDirectory() as folder:
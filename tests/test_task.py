@@ -53,6 +53,10 @@ class TestConcatTasks(unittest.TestCase):
         self.assertEqual(new_task["X_c"][ctx_idx].shape, (2, 15))
         self.assertEqual(new_task["Y_c"][ctx_idx].shape, (1, 15))
 
+        # The original task is unaffected
+        self.assertEqual(task["X_c"][ctx_idx].shape, (2, 10))
+        self.assertEqual(task["Y_c"][ctx_idx].shape, (1, 10))
+
     def test_concat_obs_to_task_wrong_context_index(self):
         # Sample 10 context observations
         task = self.task_loader("2014-12-31", context_sampling=10)
@@ -81,3 +85,15 @@ class TestConcatTasks(unittest.TestCase):
 
         with self.assertRaises(GriddedDataError):
             new_task = append_obs_to_task(task, X_new, Y_new, ctx_idx)
+
+    def test_shallow_copy_does_not_modify_original(self):
+        task = self.task_loader("2014-12-31", context_sampling=10, target_sampling=10)
+        X_t_new = np.random.randn(2, 5)
+
+        task_copy = task.shallow_copy(X_t=[X_t_new])
+        task_copy["ops"].append("test_op")
+
+        self.assertIs(task_copy["X_t"][0], X_t_new)
+        self.assertIsNot(task["X_t"][0], X_t_new)
+        self.assertIs(task_copy["Y_c"][0], task["Y_c"][0])
+        self.assertNotIn("test_op", task["ops"])